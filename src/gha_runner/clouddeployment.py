@@ -1,6 +1,6 @@
 from copy import deepcopy
 from abc import ABC, abstractmethod
-from gha_runner.gh import GitHubInstance, MissingRunnerLabel
+from gha_runner.gh import GitHubInstance, RunnerRemovalError
 from gha_runner.helper.workflow_cmds import warning, error
 from dataclasses import dataclass, field
 from typing import Type
@@ -232,20 +232,23 @@ class TeardownInstance:
         print("Removing GitHub Actions Runner")
         instance_ids = list(mappings.keys())
         labels = list(mappings.values())
-        for label in labels:
-            try:
-                print(f"Removing runner {label}")
-                self.gh.remove_runner(label)
-            # This occurs when we have a runner that might already be shutdown.
-            # Since we are mainly using the ephemeral runners, we expect this to happen
-            except MissingRunnerLabel:
-                print(f"Runner {label} does not exist, skipping...")
-                continue
-            # This is more of the case when we have a failure to remove the runner
-            # This is not a concern for the user (because we will remove the instance anyways),
-            # but we should log it for debugging purposes.
-            except Exception as e:
-                warning(title="Failed to remove runner", message=e)
+        if labels:
+            print(f"Removing runners {', '.join(labels)}")
+        missing = []
+        try:
+            missing = self.gh.remove_runners(labels)
+        # This is more of the case when we have a failure to remove a runner
+        # This is not a concern for the user (because we will remove the instance anyways),
+        # but we should log it for debugging purposes.
+        except RunnerRemovalError as e:
+            missing = e.missing
+            warning(title="Failed to remove runner", message=e)
+        except Exception as e:
+            warning(title="Failed to remove runner", message=e)
+        # This occurs when we have a runner that might already be shutdown.
+        # Since we are mainly using the ephemeral runners, we expect this to happen
+        for label in missing:
+            print(f"Runner {label} does not exist, skipping...")
         print("Removing instances...")
         self.provider.remove_instances(instance_ids)
         print("Waiting for instance to be removed...")
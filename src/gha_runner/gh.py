@@ -2,13 +2,22 @@
 
 import collections.abc
 import random
+import re
 import string
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from json import JSONDecodeError
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_RUNNER_ASSET_PATTERN = re.compile(
+    r"actions-runner-(?P<platform>[a-z]+)-(?P<arch>[a-z0-9]+)"
+    r"-(?P<version>\d+(?:\.\d+)*)\.tar\.gz"
+)
 
 
 class TokenRetrievalError(Exception):
@@ -23,6 +32,26 @@ class RunnerListError(Exception):
     """Exception raised when there is an error getting the list of runners."""
 
 
+class RunnerRemovalError(RuntimeError):
+    """Exception raised when one or more runners could not be removed.
+
+    Parameters
+    ----------
+    failures : list[str]
+        An error message for each runner that could not be removed.
+    missing : list[str]
+        The labels that did not match any runner and were skipped.
+
+    """
+
+    def __init__(self, failures: list[str], missing: list[str]):
+        super().__init__(
+            f"Error removing runners. Errors: {'; '.join(failures)}"
+        )
+        self.failures = failures
+        self.missing = missing
+
+
 @dataclass
 class SelfHostedRunner:
     id: int
@@ -52,11 +81,50 @@ class GitHubInstance:
     """
 
     BASE_URL = "https://api.github.com"
+    # Upper bound on concurrent requests made when fanning out API calls.
+    MAX_WORKERS = 16
+    # Largest page size allowed by the runners endpoint.
+    RUNNERS_PER_PAGE = 100
+    # Transient API responses that are retried with backoff.
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
 
     def __init__(self, token: str, repo: str):
         self.token = token
         self.headers = self._headers({})
         self.repo = repo
+        self._session = self._build_session()
+        self._runner_assets: dict[tuple[str, str], str] | None = None
+
+    def _build_session(self) -> requests.Session:
+        """Build a session that reuses connections to the GitHub API.
+
+        Requests that fail with a transient status are retried with backoff.
+        Once the retries are exhausted, the last response is returned so that
+        ``_do_request`` reports it like any other failed call.
+
+        Returns
+        -------
+        requests.Session
+            A session with the API headers set, retries on transient errors,
+            and a connection pool large enough for concurrent requests.
+
+        """
+        session = requests.Session()
+        session.headers.update(self.headers)
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=["GET", "POST", "DELETE"],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.MAX_WORKERS,
+            pool_maxsize=2 * self.MAX_WORKERS,
+            max_retries=retries,
+        )
+        session.mount("https://", adapter)
+        return session
 
     def _headers(self, header_kwargs):
         """Generate headers for API requests, adding authorization and specific API version.
@@ -88,8 +156,7 @@ class GitHubInstance:
         This can be removed if this is added into PyGitHub.
         """
         endpoint_url = urllib.parse.urljoin(self.BASE_URL, endpoint)
-        headers = self.headers
-        resp: requests.Response = func(endpoint_url, headers=headers, **kwargs)
+        resp: requests.Response = func(endpoint_url, **kwargs)
         if not resp.ok:
             raise RuntimeError(
                 f"Error in API call for {endpoint_url}: " f"{resp.content}"
@@ -102,6 +169,8 @@ class GitHubInstance:
 
     def create_runner_tokens(self, count: int) -> list[str]:
         """Generate registration tokens for GitHub Actions runners.
+
+        The tokens are requested concurrently over the shared session.
         This can be removed if this is added into PyGitHub.
 
         Parameters
@@ -118,11 +187,15 @@ class GitHubInstance:
             If there is an error generating the tokens.
 
         """
-        tokens = []
-        for _ in range(count):
-            token = self.create_runner_token()
-            tokens.append(token)
-        return tokens
+        if count < 1:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(count, self.MAX_WORKERS)
+        ) as executor:
+            futures = [
+                executor.submit(self.create_runner_token) for _ in range(count)
+            ]
+            return [future.result() for future in futures]
 
     def create_runner_token(self) -> str:
         """Generate a registration token for GitHub Actions runners.
@@ -162,7 +235,7 @@ class GitHubInstance:
             See the requests.post documentation for more information.
 
         """
-        return self._do_request(requests.post, endpoint, **kwargs)
+        return self._do_request(self._session.post, endpoint, **kwargs)
 
     def get(self, endpoint, **kwargs):
         """Make a GET request to the GitHub API.
@@ -175,7 +248,7 @@ class GitHubInstance:
             Additional keyword arguments to pass to the request.
             See the requests.get documentation for more information.
         """
-        return self._do_request(requests.get, endpoint, **kwargs)
+        return self._do_request(self._session.get, endpoint, **kwargs)
 
     def delete(self, endpoint, **kwargs):
         """Make a DELETE request to the GitHub API.
@@ -188,7 +261,7 @@ class GitHubInstance:
             Additional keyword arguments to pass to the request.
             See the requests.delete documentation for more information.
         """
-        return self._do_request(requests.delete, endpoint, **kwargs)
+        return self._do_request(self._session.delete, endpoint, **kwargs)
 
     def get_runners(self) -> list[SelfHostedRunner] | None:
         """Get a list of self-hosted runners in the repository.
@@ -206,25 +279,54 @@ class GitHubInstance:
             an error in the request or the response is not a mapping object.
         """
         runners = []
+        page = 1
         try:
-            res = self.get(f"repos/{self.repo}/actions/runners")
-            # This allows for arbitrary mappable objects to be used
-            if not isinstance(res, collections.abc.Mapping):
-                # This could be related to the API or the request itself.
-                # ie the response is not a JSON object
-                raise RunnerListError(f"Did not receive mapping object: {res}")
-            for runner in res["runners"]:
-                id = runner["id"]
-                name = runner["name"]
-                os = runner["os"]
-                labels = [label["name"] for label in runner["labels"]]
-                runners.append(SelfHostedRunner(id, name, os, labels))
+            while True:
+                res = self.get(
+                    f"repos/{self.repo}/actions/runners",
+                    params={"per_page": self.RUNNERS_PER_PAGE, "page": page},
+                )
+                # This allows for arbitrary mappable objects to be used
+                if not isinstance(res, collections.abc.Mapping):
+                    # This could be related to the API or the request itself.
+                    # ie the response is not a JSON object
+                    raise RunnerListError(
+                        f"Did not receive mapping object: {res}"
+                    )
+                for runner in res["runners"]:
+                    id = runner["id"]
+                    name = runner["name"]
+                    os = runner["os"]
+                    labels = [label["name"] for label in runner["labels"]]
+                    runners.append(SelfHostedRunner(id, name, os, labels))
+                # A short page means there are no more runners to fetch
+                if len(res["runners"]) < self.RUNNERS_PER_PAGE:
+                    break
+                page += 1
             return runners if len(runners) > 0 else None
         except RuntimeError as e:
             # This occurs when we receive a status code is > 400
             raise RunnerListError(f"Error getting runners: {e}")
             # Other exceptions are bubbled up to the caller
 
+    def _runner_index(self) -> dict[str, list[SelfHostedRunner]]:
+        """Index the self-hosted runners in the repository by label.
+
+        The runners are listed once and every label is mapped to the runners
+        carrying it, so any number of label lookups costs a single listing.
+
+        Returns
+        -------
+        dict[str, list[SelfHostedRunner]]
+            A mapping of runner labels to the runners with that label.
+
+        """
+        index: dict[str, list[SelfHostedRunner]] = {}
+        for runner in self.get_runners() or []:
+            for label in runner.labels:
+                index.setdefault(label, []).append(runner)
+        return index
+
     def get_runner(self, label: str) -> SelfHostedRunner:
         """Get a runner by a given label for a repository.
 
@@ -239,50 +341,85 @@ class GitHubInstance:
             If the runner with the given label is not found.
 
         """
-        runners = self.get_runners()
-        if runners is not None:
-            for runner in runners:
-                if label in runner.labels:
-                    return runner
+        runners = self._runner_index().get(label)
+        if runners:
+            return runners[0]
         raise MissingRunnerLabel(f"Runner {label} not found")
 
+    @staticmethod
+    def _backoff_delay(attempt: int, base: float, cap: float) -> float:
+        """Return a jittered, capped exponential backoff delay.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of failed checks so far, starting from 0.
+        base : float
+            The delay in seconds before jitter of the first retry.
+        cap : float
+            The maximum delay in seconds before jitter.
+
+        Returns
+        -------
+        float
+            A delay between half and all of ``min(cap, base * 2**attempt)``.
+
+        """
+        delay = min(cap, base * 2**attempt)
+        return delay * (0.5 + random.random() / 2)
+
     def wait_for_runner(
-        self, label: str, timeout: int, wait: int = 15
+        self,
+        label: str,
+        timeout: int = 600,
+        wait: float = 5,
+        max_wait: float = 30,
     ) -> SelfHostedRunner:
         """Wait for the runner with the given label to be online.
 
+        Checks back off exponentially with jitter, so the first checks come
+        quickly and many concurrent waiters do not poll the API in lockstep.
+
         Parameters
         ----------
         label : str
             The label of the runner to wait for.
-        wait : int
-            The time in seconds to wait between checks. Defaults to 15 seconds.
         timeout : int
             The maximum time in seconds to wait for the runner to be online.
+            Defaults to 600 seconds.
+        wait : float
+            The base time in seconds to wait between checks. Defaults to 5
+            seconds.
+        max_wait : float
+            The maximum time in seconds to wait between checks. Defaults to 30
+            seconds.
 
         Returns
         -------
         SelfHostedRunner
             The runner with the given label.
 
+        Raises
+        ------
+        RuntimeError
+            If the runner is not found before the timeout is reached.
+
         """
-        max = time.time() + timeout
-        try:
-            runner = self.get_runner(label)
-            return runner
-        except MissingRunnerLabel:
-            print(f"Waiting for runner {label}...")
-            while True:
-                if time.time() > max:
-                    raise RuntimeError(
-                        f"Timeout reached: Runner {label} not found"
-                    )
-                try:
-                    runner = self.get_runner(label)
-                    return runner
-                except MissingRunnerLabel:
-                    print(f"Runner {label} not found. Waiting...")
-                    time.sleep(wait)
+        deadline = time.time() + timeout
+        attempt = 0
+        while True:
+            try:
+                return self.get_runner(label)
+            except MissingRunnerLabel:
+                pass
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise RuntimeError(f"Timeout reached: Runner {label} not found")
+            print(f"Runner {label} not found. Waiting...")
+            # Never sleep past the deadline, so the last check happens on time
+            delay = self._backoff_delay(attempt, wait, max_wait)
+            time.sleep(min(delay, remaining))
+            attempt += 1
 
     def remove_runner(self, label: str):
         """Remove a runner by a given label.
@@ -301,6 +438,63 @@ class GitHubInstance:
         except Exception as e:
             raise RuntimeError(f"Error removing runner {label}. Error: {e}")
 
+    def remove_runners(self, labels: list[str]) -> list[str]:
+        """Remove the runners with the given labels.
+
+        The runners are looked up with a single listing and deleted
+        concurrently over the shared session. A runner matched by several
+        of the labels is only deleted once.
+
+        Parameters
+        ----------
+        labels : list[str]
+            The labels of the runners to remove.
+
+        Returns
+        -------
+        list[str]
+            The labels that did not match any runner and were skipped.
+
+        Raises
+        ------
+        RunnerRemovalError
+            If any runner could not be removed. Every removal is attempted
+            before the error is raised, and the skipped labels are available
+            on its ``missing`` attribute.
+        RunnerListError
+            If there is an error getting the list of runners.
+
+        """
+        if not labels:
+            return []
+        index = self._runner_index()
+        missing = [label for label in labels if label not in index]
+        # Group the labels by runner so each runner is deleted exactly once
+        targets: dict[int, list[str]] = {}
+        for label in labels:
+            if label in index:
+                targets.setdefault(index[label][0].id, []).append(label)
+        if not targets:
+            return missing
+        with ThreadPoolExecutor(
+            max_workers=min(len(targets), self.MAX_WORKERS)
+        ) as executor:
+            futures = {
+                runner_id: executor.submit(
+                    self.delete,
+                    f"repos/{self.repo}/actions/runners/{runner_id}",
+                )
+                for runner_id in targets
+            }
+        failures = [
+            f"{', '.join(targets[runner_id])}: {future.exception()}"
+            for runner_id, future in futures.items()
+            if future.exception() is not None
+        ]
+        if failures:
+            raise RunnerRemovalError(failures, missing)
+        return missing
+
     @staticmethod
     def generate_random_label() -> str:
         """Generate a random label for a runner.
@@ -314,7 +508,7 @@ class GitHubInstance:
 
         """
         letters = string.ascii_lowercase + string.digits
-        result_str = "".join(random.choice(letters) for i in range(8))
+        result_str = "".join(random.choices(letters, k=8))
         return f"runner-{result_str}"
 
     def _get_latest_release(self, repo: str) -> dict:
@@ -325,8 +519,8 @@ class GitHubInstance:
             The repository to get the latest release for.
         Returns
         -------
-        str
-            The tag name of the latest release.
+        dict
+            The latest release as returned by the GitHub API.
         """
         try:
             release = self.get(f"repos/{repo}/releases/latest")
@@ -334,6 +528,35 @@ class GitHubInstance:
         except Exception as e:
             raise RuntimeError(f"Error getting latest release: {e}")
 
+    @staticmethod
+    def _index_runner_assets(assets: list[dict]) -> dict[tuple[str, str], str]:
+        """Index runner release assets by platform and architecture.
+
+        Only assets named exactly
+        ``actions-runner-<platform>-<arch>-<version>.tar.gz`` are indexed, so
+        ``arm`` does not match ``arm64`` assets and suffixed variants such as
+        ``-noexternals`` packages are skipped.
+
+        Parameters
+        ----------
+        assets : list[dict]
+            The assets of a runner release as returned by the GitHub API.
+
+        Returns
+        -------
+        dict[tuple[str, str], str]
+            A mapping of ``(platform, architecture)`` to the download URL.
+
+        """
+        index = {}
+        for asset in assets:
+            match = _RUNNER_ASSET_PATTERN.fullmatch(asset["name"])
+            if match is not None:
+                index[(match["platform"], match["arch"])] = asset[
+                    "browser_download_url"
+                ]
+        return index
+
     def get_latest_runner_release(
         self, platform: str, architecture: str
     ) -> str:
@@ -371,11 +594,12 @@ class GitHubInstance:
                 f"Architecture '{architecture}' not supported for platform '{platform}'. "
                 f"Supported architectures are {supported_platforms[platform]}"
             )
-        release = self._get_latest_release(repo)
-        assets = release["assets"]
-        for asset in assets:
-            if platform in asset["name"] and architecture in asset["name"]:
-                return asset["browser_download_url"]
+        if self._runner_assets is None:
+            release = self._get_latest_release(repo)
+            self._runner_assets = self._index_runner_assets(release["assets"])
+        url = self._runner_assets.get((platform, architecture))
+        if url is not None:
+            return url
         raise RuntimeError(
             f"Runner release not found for platform {platform} and architecture {architecture}"
         )
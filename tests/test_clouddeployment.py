@@ -6,7 +6,7 @@ from gha_runner.clouddeployment import (
     StopCloudInstance,
     TeardownInstance,
 )
-from gha_runner.gh import GitHubInstance, MissingRunnerLabel
+from gha_runner.gh import GitHubInstance, RunnerRemovalError
 
 
 class MockStartCloudInstance(CreateCloudInstance):
@@ -54,6 +54,7 @@ class MockFailableWaitStop(StopCloudInstance):
 def gh_mock():
     gh_mock = Mock(spec=GitHubInstance)
     gh_mock.create_runner_tokens.return_value = ["token1"]
+    gh_mock.remove_runners.return_value = []
     gh_mock.get_latest_runner_release.return_value = "https://github.com/actions/runner/releases/download/v2.278.0/actions-runner-linux-x64-2.278.0.tar.gz"
     yield gh_mock
 
@@ -88,11 +89,11 @@ def test_teardown_instance_stop_runner(gh_mock):
         gh=gh_mock,
     )
     teardown.stop_runner_instances()
-    gh_mock.remove_runner.assert_called_once_with("runner-1")
+    gh_mock.remove_runners.assert_called_once_with(["runner-1"])
 
 
-def test_teardown_instance_missing(gh_mock):
-    gh_mock.remove_runner.side_effect = MissingRunnerLabel("runner-1")
+def test_teardown_instance_missing(gh_mock, capsys):
+    gh_mock.remove_runners.return_value = ["runner-1"]
 
     teardown = TeardownInstance(
         provider_type=MockStopCloudInstance,
@@ -100,6 +101,8 @@ def test_teardown_instance_missing(gh_mock):
         gh=gh_mock,
     )
     teardown.stop_runner_instances()  # No exception raised
+    captured = capsys.readouterr()
+    assert "Runner runner-1 does not exist, skipping..." in captured.out
 
 
 def test_teardown_instance_malformed_instance_mapping(gh_mock):
@@ -118,7 +121,7 @@ def test_teardown_instance_malformed_instance_mapping(gh_mock):
 
 
 def test_teardown_instance_failure(gh_mock, capsys):
-    gh_mock.remove_runner.side_effect = Exception("Testing")
+    gh_mock.remove_runners.side_effect = Exception("Testing")
     teardown = TeardownInstance(
         provider_type=MockStopCloudInstance,
         cloud_params={},
@@ -129,7 +132,7 @@ def test_teardown_instance_failure(gh_mock, capsys):
     catpured_output = captured.out
     expected_output = ["Shutting down...",
         "Removing GitHub Actions Runner",
-        "Removing runner runner-1",
+        "Removing runners runner-1",
         "::warning title=Failed to remove runner::Testing",
         "Removing instances...",
         "Waiting for instance to be removed...",
@@ -138,6 +141,40 @@ def test_teardown_instance_failure(gh_mock, capsys):
     actual_output = catpured_output.strip().split("\n")
     assert actual_output == expected_output
 
+def test_teardown_instance_partial_failure(gh_mock, capsys):
+    # One label has no runner and the other runner fails to be removed
+    gh_mock.remove_runners.side_effect = RunnerRemovalError(
+        failures=["runner-2: Testing"], missing=["runner-1"]
+    )
+    teardown = TeardownInstance(
+        provider_type=MockStopCloudInstance,
+        cloud_params={},
+        gh=gh_mock,
+    )
+    teardown.stop_runner_instances()
+    captured = capsys.readouterr()
+    actual_output = captured.out.strip().split("\n")
+    assert "Runner runner-1 does not exist, skipping..." in actual_output
+    assert (
+        "::warning title=Failed to remove runner::"
+        "Error removing runners. Errors: runner-2: Testing"
+    ) in actual_output
+    assert actual_output[-1] == "Instances removed!"
+
+
+def test_teardown_instance_no_runners(gh_mock, capsys):
+    provider_mock = Mock(spec=MockStopCloudInstance)
+    provider_mock.get_instance_mapping.return_value = {}
+    teardown = TeardownInstance(
+        provider_type=lambda **kwargs: provider_mock,
+        cloud_params={},
+        gh=gh_mock,
+    )
+    teardown.stop_runner_instances()
+    captured = capsys.readouterr()
+    assert "Removing runners" not in captured.out
+
+
 def test_teardown_instance_failed_wait(gh_mock, capsys):
     with pytest.raises(SystemExit) as exit_info:
         teardown = TeardownInstance(
@@ -153,7 +190,7 @@ def test_teardown_instance_failed_wait(gh_mock, capsys):
     expected_output = [
         "Shutting down...",
         "Removing GitHub Actions Runner",
-        "Removing runner runner-1",
+        "Removing runners runner-1",
         "Removing instances...",
         "Waiting for instance to be removed...",
         "Failed to remove instances check your provider console: Bad wait",
@@ -1,12 +1,16 @@
+import string
+
 import pytest
 from unittest.mock import Mock, patch
 import responses
+from responses import matchers
 from gha_runner.gh import (
     GitHubInstance,
     SelfHostedRunner,
     TokenRetrievalError,
     MissingRunnerLabel,
     RunnerListError,
+    RunnerRemovalError,
 )
 
 
@@ -68,7 +72,18 @@ def test_create_runner_tokens(github_instance):
             json={"token": token},
             status=200,
         )
-    assert github_instance.create_runner_tokens(3) == tokens
+    # Tokens are requested concurrently, so only the set of tokens is stable
+    assert sorted(github_instance.create_runner_tokens(3)) == tokens
+
+
+def test_create_runner_tokens_zero(github_instance):
+    assert github_instance.create_runner_tokens(0) == []
+
+
+def test_session_headers(github_instance):
+    assert github_instance._session.headers["Authorization"] == (
+        "Bearer fake-token"
+    )
 
 
 @responses.activate
@@ -95,6 +110,47 @@ def test_get_runners(github_instance):
     assert runners[0].labels == ["test-label"]
 
 
+@responses.activate
+def test_get_runners_paginated(github_instance):
+    url = "https://api.github.com/repos/test/test/actions/runners"
+    per_page = GitHubInstance.RUNNERS_PER_PAGE
+    first_page = [
+        {"id": i, "name": f"r{i}", "os": "linux", "labels": [{"name": f"l{i}"}]}
+        for i in range(per_page)
+    ]
+    second_page = [
+        {"id": per_page, "name": "last", "os": "linux", "labels": []}
+    ]
+    responses.add(
+        responses.GET,
+        url,
+        json={"runners": first_page},
+        match=[
+            matchers.query_param_matcher({"per_page": per_page, "page": 1})
+        ],
+    )
+    responses.add(
+        responses.GET,
+        url,
+        json={"runners": second_page},
+        match=[
+            matchers.query_param_matcher({"per_page": per_page, "page": 2})
+        ],
+    )
+    runners = github_instance.get_runners()
+    assert len(runners) == per_page + 1
+    assert runners[-1].name == "last"
+
+
+@responses.activate
+def test_get_runners_retries_transient_error(github_instance):
+    url = "https://api.github.com/repos/test/test/actions/runners"
+    responses.add(responses.GET, url, status=503)
+    responses.add(responses.GET, url, json={"runners": []}, status=200)
+    assert github_instance.get_runners() is None
+    assert len(responses.calls) == 2
+
+
 @responses.activate
 def test_get_runners_empty(github_instance):
     responses.add(
@@ -140,6 +196,20 @@ def test_get_runner_by_label(github_instance, mock_runner):
         assert runner.name == "test-runner"
 
 
+def test_get_runner_from_index(github_instance, mock_runner):
+    other = SelfHostedRunner(
+        id=2, name="other-runner", os="linux", labels=["other-label"]
+    )
+    with patch.object(
+        github_instance, "get_runners", return_value=[other, mock_runner]
+    ):
+        assert github_instance._runner_index() == {
+            "other-label": [other],
+            "test-label": [mock_runner],
+        }
+        assert github_instance.get_runner("test-label") == mock_runner
+
+
 def test_get_runner_missing_label(github_instance):
     with patch.object(github_instance, "get_runners", return_value=[]):
         with pytest.raises(MissingRunnerLabel):
@@ -169,10 +239,91 @@ def test_remove_runner_error(github_instance, mock_runner):
             github_instance.remove_runner("test-label")
 
 
+@responses.activate
+def test_remove_runners(github_instance, mock_runner):
+    other = SelfHostedRunner(
+        id=2, name="other-runner", os="linux", labels=["other-label"]
+    )
+    with patch.object(
+        github_instance, "get_runners", return_value=[mock_runner, other]
+    ):
+        for runner in (mock_runner, other):
+            responses.add(
+                responses.DELETE,
+                f"https://api.github.com/repos/test/test/actions/runners/{runner.id}",
+                status=204,
+            )
+        missing = github_instance.remove_runners(
+            ["test-label", "other-label", "gone-label"]
+        )
+        assert missing == ["gone-label"]
+        assert len(responses.calls) == 2
+
+
+def test_remove_runners_empty(github_instance):
+    with patch.object(github_instance, "get_runners") as get_runners:
+        assert github_instance.remove_runners([]) == []
+        get_runners.assert_not_called()
+
+
+@responses.activate
+def test_remove_runners_dedupes_runner(github_instance):
+    runner = SelfHostedRunner(
+        id=1, name="test-runner", os="linux", labels=["label-a", "label-b"]
+    )
+    with patch.object(github_instance, "get_runners", return_value=[runner]):
+        responses.add(
+            responses.DELETE,
+            f"https://api.github.com/repos/test/test/actions/runners/{runner.id}",
+            status=204,
+        )
+        missing = github_instance.remove_runners(["label-a", "label-b"])
+        assert missing == []
+        assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_remove_runners_error(github_instance, mock_runner):
+    other = SelfHostedRunner(
+        id=2, name="other-runner", os="linux", labels=["other-label"]
+    )
+    with patch.object(
+        github_instance, "get_runners", return_value=[mock_runner, other]
+    ):
+        responses.add(
+            responses.DELETE,
+            f"https://api.github.com/repos/test/test/actions/runners/{mock_runner.id}",
+            status=500,
+        )
+        responses.add(
+            responses.DELETE,
+            f"https://api.github.com/repos/test/test/actions/runners/{other.id}",
+            status=204,
+        )
+        with pytest.raises(
+            RunnerRemovalError, match="Error removing runners. Errors: *"
+        ) as excinfo:
+            github_instance.remove_runners(
+                ["test-label", "gone-label", "other-label"]
+            )
+        # Both the skipped label and the failed removal are reported
+        assert isinstance(excinfo.value, RuntimeError)
+        assert excinfo.value.missing == ["gone-label"]
+        assert len(excinfo.value.failures) == 1
+        assert excinfo.value.failures[0].startswith("test-label: ")
+        # The failure does not stop the remaining removals
+        assert any(
+            call.request.url.endswith(f"/runners/{other.id}")
+            for call in responses.calls
+        )
+
+
 def test_generate_random_label():
     label = GitHubInstance.generate_random_label()
     assert label.startswith("runner-")
     assert len(label) == 15  # "runner-" + 8 random chars
+    suffix = label[len("runner-") :]
+    assert all(c in string.ascii_lowercase + string.digits for c in suffix)
 
 
 @responses.activate
@@ -194,6 +345,62 @@ def test_get_latest_runner_release(github_instance):
     assert url == "https://example.com/runner.tar.gz"
 
 
+@responses.activate
+def test_get_latest_runner_release_exact_arch(github_instance):
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/actions/runner/releases/latest",
+        json={
+            "assets": [
+                {
+                    "name": "actions-runner-linux-arm64-2.0.0.tar.gz",
+                    "browser_download_url": "https://example.com/arm64.tar.gz",
+                },
+                {
+                    "name": "actions-runner-linux-arm-2.0.0.tar.gz",
+                    "browser_download_url": "https://example.com/arm.tar.gz",
+                },
+            ]
+        },
+        status=200,
+    )
+    assert (
+        github_instance.get_latest_runner_release("linux", "arm")
+        == "https://example.com/arm.tar.gz"
+    )
+    assert (
+        github_instance.get_latest_runner_release("linux", "arm64")
+        == "https://example.com/arm64.tar.gz"
+    )
+    # The release is only fetched once
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_get_latest_runner_release_skips_suffixed(github_instance):
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/actions/runner/releases/latest",
+        json={
+            "assets": [
+                {
+                    "name": "actions-runner-linux-x64-2.0.0-noexternals.tar.gz",
+                    "browser_download_url": "https://example.com/noexternals.tar.gz",
+                },
+                {
+                    "name": "actions-runner-linux-x64-2.0.0.tar.gz",
+                    "browser_download_url": "https://example.com/runner.tar.gz",
+                },
+            ]
+        },
+        status=200,
+    )
+    assert (
+        github_instance.get_latest_runner_release("linux", "x64")
+        == "https://example.com/runner.tar.gz"
+    )
+
+
 def test_get_latest_runner_release_invalid_platform(github_instance):
     with pytest.raises(ValueError):
         github_instance.get_latest_runner_release("invalid", "x64")
@@ -216,10 +423,33 @@ def test_wait_for_runner_success(mock_sleep, github_instance, mock_runner):
         ],
     ):
         runner = github_instance.wait_for_runner("test-label", timeout=30)
-        assert mock_sleep.call_count == 1
+        # One sleep between each pair of checks
+        assert mock_sleep.call_count == 2
+        assert runner == mock_runner
+
+
+@patch("random.random", return_value=1.0)  # Remove jitter
+@patch("time.sleep")  # Prevent actual sleeping in tests
+def test_wait_for_runner_backoff(
+    mock_sleep, mock_random, github_instance, mock_runner
+):
+    with patch.object(
+        github_instance,
+        "get_runner",
+        side_effect=[MissingRunnerLabel("fail")] * 6 + [mock_runner],
+    ):
+        runner = github_instance.wait_for_runner("test-label", timeout=600)
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == [5, 10, 20, 30, 30, 30]
         assert runner == mock_runner
 
 
+def test_backoff_delay_jitter():
+    with patch("random.random", return_value=0.0):
+        assert GitHubInstance._backoff_delay(0, base=5, cap=30) == 2.5
+        assert GitHubInstance._backoff_delay(10, base=5, cap=30) == 15
+
+
 @patch("time.sleep")  # Prevent actual sleeping
 def test_wait_for_runner_already_exists(
     mock_sleep, github_instance, mock_runner
@@ -259,6 +489,30 @@ def test_wait_for_runner_timeout(mock_time, mock_sleep, github_instance):
         assert mock_sleep.call_count == 1
 
 
+@patch("random.random", return_value=1.0)  # Remove jitter
+@patch("time.sleep")  # Prevent actual sleeping in tests
+@patch("time.time")  # Control time for timeout logic
+def test_wait_for_runner_sleep_capped_by_deadline(
+    mock_time, mock_sleep, mock_random, github_instance
+):
+    # Deadline is 30, only 5 seconds remain after the first check
+    mock_time.side_effect = [0, 25, 31]
+
+    with patch.object(
+        github_instance,
+        "get_runner",
+        side_effect=[
+            MissingRunnerLabel("Initial fail"),
+            MissingRunnerLabel("Final fail"),
+        ],
+    ) as mock_get_runner:
+        with pytest.raises(RuntimeError, match="Timeout reached: *"):
+            github_instance.wait_for_runner("test-label", timeout=30, wait=10)
+        mock_sleep.assert_called_once_with(5)
+        # The runner is checked once more after the last sleep
+        assert mock_get_runner.call_count == 2
+
+
 @responses.activate
 def test_get_latest_release(github_instance):
     json = {